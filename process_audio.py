@@ -1,11 +1,27 @@
+import asyncio
+import atexit
 import boto3
+import functools
+import hashlib
 import os
 import time
 import logging
+import logging.handlers
+import queue
+import io
 import json
-import urllib.request
+import random
 import re
-from botocore.exceptions import ClientError
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import BinaryIO, Callable, Iterator
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
 # -----------------------------
 # Configuration (env + constants)
@@ -17,6 +33,46 @@ INPUT_FOLDER = "audio_inputs/"
 TARGET_LANGUAGE = "es"   # Spanish
 SOURCE_LANGUAGE = "en"   # English
 
+# Number of files processed concurrently (the pipeline is I/O-bound on AWS calls)
+MAX_WORKERS = int(os.environ.get("MAX_WORKERS", "8"))
+
+# Transcribe polling: start short, back off exponentially up to POLL_MAX seconds
+POLL_INITIAL = float(os.environ.get("POLL_INITIAL", "2"))
+POLL_MAX = float(os.environ.get("POLL_MAX", "30"))
+
+# Optional: SQS queue fed by an EventBridge rule for "Transcribe Job State Change"
+# events (directly or via SNS). When set, jobs are awaited on the queue instead of polled.
+TRANSCRIBE_EVENTS_QUEUE_URL = os.environ.get("TRANSCRIBE_EVENTS_QUEUE_URL")
+# Seconds to wait for an event before checking the job directly (covers lost events)
+TRANSCRIBE_EVENTS_FALLBACK = float(os.environ.get("TRANSCRIBE_EVENTS_FALLBACK", "120"))
+
+# "batch" (default) runs a Transcribe job per file. "streaming" decodes the MP3 with
+# ffmpeg, sends it to Transcribe streaming (needs the optional amazon-transcribe package)
+# and translates + synthesizes each finalized segment while the rest is still transcribing.
+TRANSCRIBE_MODE = os.environ.get("TRANSCRIBE_MODE", "batch")
+STREAMING_SAMPLE_RATE = 16000
+STREAMING_CHUNK_BYTES = 8 * 1024
+
+# Translate rejects input over 10,000 UTF-8 bytes; chunk below that and fan out
+TRANSLATE_CHUNK_BYTES = 9500
+TRANSLATE_MAX_WORKERS = 10
+
+# Translations are memoized per sentence by content hash and persisted to S3 between runs.
+# Bump the version when sentence splitting or batching changes what gets cached: older
+# entries then stop matching and the previous cache file is ignored.
+TRANSLATION_CACHE_SIZE = 20000
+TRANSLATION_CACHE_VERSION = 2
+TRANSLATION_CACHE_KEY = f"{ENVIRONMENT}/translation-cache/sentences-v{TRANSLATION_CACHE_VERSION}.json"
+
+# Transcripts at least this many UTF-8 bytes are not re-uploaded as .txt; Transcribe's JSON
+# output is copied server-side to transcripts/<base>.json instead. Speech runs roughly
+# 1 KB of text per minute, so the 64 KiB default covers recordings over about an hour.
+TRANSCRIPT_COPY_BYTES = int(os.environ.get("TRANSCRIPT_COPY_BYTES", str(64 * 1024)))
+
+# Polly caps a request at 3000 billed characters; leave headroom and fan out the chunks
+POLLY_CHUNK_CHARS = 2800
+POLLY_MAX_WORKERS = 8
+
 # Fail fast if required env vars are missing
 if not S3_BUCKET_NAME:
     raise ValueError("Missing env var S3_BUCKET_NAME. Set it before running.")
@@ -24,106 +80,380 @@ if not S3_BUCKET_NAME:
 # -----------------------------
 # Logging
 # -----------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Worker threads only enqueue records; a single listener thread does the formatting
+# I/O, so concurrent workers don't contend on the stream handler's lock.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # final layout is applied by _log_handler
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger(__name__)
 
 # -----------------------------
 # AWS Clients
 # -----------------------------
-s3_client = boto3.client("s3")
-transcribe_client = boto3.client("transcribe")
-translate_client = boto3.client("translate")
-polly_client = boto3.client("polly")
+# Default pool (10) is too small once several threads share a client (e.g. multipart
+# transfers); adaptive retries also absorb throttling when many files hit one API at once.
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=max(50, MAX_WORKERS),
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
 
-def download_inputs_from_s3():
-    """Download MP3 files from s3://bucket/<env>/audio_inputs/ into local audio_inputs/"""
-    os.makedirs(INPUT_FOLDER, exist_ok=True)
+# One shared session (credentials, service models) and one set of clients per worker
+# thread, so each worker gets its own connection pool instead of contending on one.
+_SESSION = boto3.session.Session()
+_SESSION_LOCK = threading.Lock()
+_THREAD_CLIENTS = threading.local()
 
-    prefix = f"{ENVIRONMENT}/audio_inputs/"
-    resp = s3_client.list_objects_v2(Bucket=S3_BUCKET_NAME, Prefix=prefix)
 
-    contents = resp.get("Contents", [])
-    if not contents:
-        logging.info(f"No objects found in s3://{S3_BUCKET_NAME}/{prefix}")
-        return 0
+def _client(service: str):
+    """Return the calling thread's client for service, creating it on first use."""
+    client = getattr(_THREAD_CLIENTS, service, None)
+    if client is None:
+        # Session objects are not thread-safe; only client creation needs the lock
+        with _SESSION_LOCK:
+            client = _SESSION.client(service, config=AWS_CLIENT_CONFIG)
+        setattr(_THREAD_CLIENTS, service, client)
+    return client
+
+
+def s3_client():
+    return _client("s3")
+
+
+def transcribe_client():
+    return _client("transcribe")
+
+
+def translate_client():
+    return _client("translate")
+
+
+def polly_client():
+    return _client("polly")
+
+
+def sqs_client():
+    return _client("sqs")
+
+
+# Polly audio is streamed straight into a multipart upload as it arrives
+AUDIO_UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=5 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+# Local input MP3s (typically 20-200 MB) are uploaded in 8 MB parts, 16 at a time
+UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+
 
-    downloaded = 0
-    for obj in contents:
-        key = obj["Key"]
-        if key.lower().endswith(".mp3"):
-            local_path = os.path.join(INPUT_FOLDER, os.path.basename(key))
-            s3_client.download_file(S3_BUCKET_NAME, key, local_path)
-            logging.info(f"Downloaded {key} -> {local_path}")
-            downloaded += 1
+def _iter_mp3_keys(prefix: str) -> Iterator[str]:
+    """Yield every .mp3 key under prefix, following list_objects_v2 pagination."""
+    paginator = s3_client().get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=S3_BUCKET_NAME, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            if obj["Key"].lower().endswith(".mp3"):
+                yield obj["Key"]
 
-    return downloaded
+
+def _output_base(s3_key: str) -> str:
+    """Name used for a key's outputs: its path under the input prefix, minus the extension.
+
+    Keeping subfolders means audio_inputs/x.mp3 and audio_inputs/sub/x.mp3 don't overwrite
+    each other's transcripts/translations/audio.
+    """
+    prefix = f"{ENVIRONMENT}/audio_inputs/"
+    relative = s3_key[len(prefix):] if s3_key.startswith(prefix) else s3_key.rsplit("/", 1)[-1]
+    base, _ = os.path.splitext(relative)
+    return base
 
 
 def upload_to_s3(file_path: str, object_name: str) -> bool:
     """Upload a file to an S3 bucket."""
     try:
-        s3_client.upload_file(file_path, S3_BUCKET_NAME, object_name)
-        logging.info(f"Uploaded {file_path} to s3://{S3_BUCKET_NAME}/{object_name}")
+        s3_client().upload_file(file_path, S3_BUCKET_NAME, object_name, Config=UPLOAD_CONFIG)
+        logger.info("Uploaded %s to s3://%s/%s", file_path, S3_BUCKET_NAME, object_name)
         return True
-    except ClientError as e:
-        logging.error(f"S3 Upload Error: {e}", exc_info=True)
+    except (ClientError, S3UploadFailedError) as e:
+        logger.error("S3 Upload Error: %s", e, exc_info=True)
         return False
 
 
-def start_transcription_job(job_name: str, s3_uri: str) -> None:
+def _transcribe_output_key(job_name: str) -> str:
+    """S3 key where Transcribe writes the result JSON for job_name."""
+    return f"{ENVIRONMENT}/transcribe-output/{job_name}.json"
+
+
+def start_transcription_job(job_name: str, s3_uri: str) -> bool:
     """Start an Amazon Transcribe job."""
     try:
-        transcribe_client.start_transcription_job(
+        transcribe_client().start_transcription_job(
             TranscriptionJobName=job_name,
             Media={"MediaFileUri": s3_uri},
             MediaFormat="mp3",
             LanguageCode="en-US",
             # Optional but recommended: put output in your bucket for easier debugging
             OutputBucketName=S3_BUCKET_NAME,
-            OutputKey=f"{ENVIRONMENT}/transcribe-output/{job_name}.json",
+            OutputKey=_transcribe_output_key(job_name),
         )
-        logging.info(f"Transcription job {job_name} started.")
+        logger.info("Transcription job %s started.", job_name)
+        return True
     except Exception as e:
-        logging.error(f"Error starting transcription job: {e}", exc_info=True)
+        logger.error("Error starting transcription job: %s", e, exc_info=True)
+        return False
 
 
-def get_transcription_result(job_name: str) -> str | None:
-    """Wait for transcription job and return the transcript text."""
+def _poll_transcription_job(job_name: str) -> dict:
+    """Poll Transcribe until the job finishes and return the final job description."""
+    delay = POLL_INITIAL
     while True:
-        result = transcribe_client.get_transcription_job(TranscriptionJobName=job_name)
+        result = transcribe_client().get_transcription_job(TranscriptionJobName=job_name)
         status = result["TranscriptionJob"]["TranscriptionJobStatus"]
 
         if status in ["COMPLETED", "FAILED"]:
-            break
+            return result
+
+        # Jitter keeps concurrent workers from polling in lockstep
+        wait = delay + random.uniform(0, delay * 0.1)
+        logger.info("Transcription job status: %s. Waiting %.1fs...", status, wait)
+        time.sleep(wait)
+        delay = min(POLL_MAX, delay * 1.5)
+
 
-        logging.info(f"Transcription job status: {status}. Waiting 30s...")
-        time.sleep(30)
+def _job_event_detail(body: str) -> dict:
+    """Extract the EventBridge event detail from an SQS message body (raw or SNS-wrapped)."""
+    try:
+        event = json.loads(body)
+        if "Message" in event and "detail" not in event:
+            event = json.loads(event["Message"])
+        detail = event.get("detail")
+    except (ValueError, TypeError, AttributeError):
+        return {}
+    return detail if isinstance(detail, dict) else {}
+
+
+# Every Transcribe job this run starts is named with this prefix, so a dispatcher sharing
+# the events queue with another run (e.g. overlapping beta and prod) only consumes its own.
+_JOB_NAME_PREFIX = f"job-{uuid.uuid4().hex[:12]}-"
+
+# Completion events are read by a single dispatcher thread and handed to the worker
+# waiting on that job. Events that arrive before their waiter registers are kept briefly.
+_JOB_WAITERS: dict[str, Future] = {}
+_UNCLAIMED_EVENTS: OrderedDict[str, dict] = OrderedDict()
+_UNCLAIMED_EVENTS_MAX = 1000
+_JOB_EVENTS_LOCK = threading.Lock()
+_JOB_EVENTS_DISPATCHER: threading.Thread | None = None
+
+
+def _handle_job_event(msg: dict, to_delete: list[dict]) -> None:
+    """Resolve (or park) the waiter for one SQS message, queueing it for deletion if it is ours.
+
+    Messages that aren't job events at all (e.g. an SNS SubscriptionConfirmation) are
+    logged and deleted. Events for jobs started by another run are left on the queue for
+    that run; they come back to it after the visibility timeout.
+    """
+    detail = _job_event_detail(msg["Body"])
+    job_name = detail.get("TranscriptionJobName")
+    if not job_name:
+        logger.warning("Deleting non-Transcribe message %s from the events queue", msg.get("MessageId"))
+        to_delete.append({"Id": str(len(to_delete)), "ReceiptHandle": msg["ReceiptHandle"]})
+        return
+    if not job_name.startswith(_JOB_NAME_PREFIX):
+        return
+    # Our job-state events are deleted whether or not anyone is waiting: stale or
+    # duplicate events would otherwise be redelivered forever. Waiters that miss an
+    # event still finish through the GetTranscriptionJob fallback.
+    to_delete.append({"Id": str(len(to_delete)), "ReceiptHandle": msg["ReceiptHandle"]})
+    if detail.get("TranscriptionJobStatus") not in ["COMPLETED", "FAILED"]:
+        return
+    with _JOB_EVENTS_LOCK:
+        waiter = _JOB_WAITERS.get(job_name)
+        if waiter is None:
+            _UNCLAIMED_EVENTS[job_name] = detail
+            while len(_UNCLAIMED_EVENTS) > _UNCLAIMED_EVENTS_MAX:
+                _UNCLAIMED_EVENTS.popitem(last=False)
+    if waiter is not None and not waiter.done():
+        waiter.set_result(detail)
+
+
+def _dispatch_job_events() -> None:
+    """Long-poll the events queue forever, resolving waiters and deleting this run's job events."""
+    delay = POLL_INITIAL
+    while True:
+        try:
+            resp = sqs_client().receive_message(
+                QueueUrl=TRANSCRIBE_EVENTS_QUEUE_URL,
+                MaxNumberOfMessages=10,
+                WaitTimeSeconds=20,
+            )
+        except (BotoCoreError, ClientError) as e:
+            logger.warning("Could not read Transcribe events from SQS: %s", e)
+            time.sleep(delay)
+            delay = min(POLL_MAX, delay * 1.5)
+            continue
+        delay = POLL_INITIAL
+
+        to_delete = []
+        for msg in resp.get("Messages", []):
+            # One malformed message must not kill the only reader; waiters rely on it
+            try:
+                _handle_job_event(msg, to_delete)
+            except Exception as e:
+                logger.warning("Ignoring unreadable Transcribe event %s: %s", msg.get("MessageId"), e)
+
+        if to_delete:
+            try:
+                sqs_client().delete_message_batch(QueueUrl=TRANSCRIBE_EVENTS_QUEUE_URL, Entries=to_delete)
+            except (BotoCoreError, ClientError) as e:
+                logger.warning("Could not delete Transcribe events from SQS: %s", e)
+
+
+def _register_job_waiter(job_name: str) -> Future:
+    """Return a future resolved with job_name's event detail, starting the dispatcher if needed."""
+    global _JOB_EVENTS_DISPATCHER
+    waiter = Future()
+    with _JOB_EVENTS_LOCK:
+        detail = _UNCLAIMED_EVENTS.pop(job_name, None)
+        if detail is not None:
+            waiter.set_result(detail)
+        else:
+            _JOB_WAITERS[job_name] = waiter
+        if _JOB_EVENTS_DISPATCHER is None:
+            _JOB_EVENTS_DISPATCHER = threading.Thread(
+                target=_dispatch_job_events, name="transcribe-events", daemon=True
+            )
+            _JOB_EVENTS_DISPATCHER.start()
+    return waiter
+
+
+def _wait_for_transcription_event(job_name: str) -> dict:
+    """Wait for job_name's completion event, checking the job directly if none arrives."""
+    logger.info("Waiting for completion event for %s on SQS...", job_name)
+    waiter = _register_job_waiter(job_name)
+    try:
+        while True:
+            try:
+                # The event carries the status (and FailureReason); the transcript itself
+                # is read from our bucket, so no GetTranscriptionJob call is needed.
+                return {"TranscriptionJob": waiter.result(timeout=TRANSCRIBE_EVENTS_FALLBACK)}
+            except FutureTimeoutError:
+                result = transcribe_client().get_transcription_job(TranscriptionJobName=job_name)
+                if result["TranscriptionJob"]["TranscriptionJobStatus"] in ["COMPLETED", "FAILED"]:
+                    logger.info("No completion event for %s; job status read directly.", job_name)
+                    return result
+    finally:
+        with _JOB_EVENTS_LOCK:
+            _JOB_WAITERS.pop(job_name, None)
+
+
+def get_transcription_result(job_name: str) -> str | None:
+    """Wait for transcription job and return the transcript text."""
+    if TRANSCRIBE_EVENTS_QUEUE_URL:
+        result = _wait_for_transcription_event(job_name)
+    else:
+        result = _poll_transcription_job(job_name)
+    status = result["TranscriptionJob"]["TranscriptionJobStatus"]
 
     if status == "FAILED":
         reason = result["TranscriptionJob"].get("FailureReason", "Unknown error")
-        logging.error(f"Transcription job failed: {reason}")
-        return None
-
-    # If COMPLETED, try to fetch transcript (signed URL) and parse text
-    transcript_uri = result["TranscriptionJob"].get("Transcript", {}).get("TranscriptFileUri")
-    if not transcript_uri:
-        logging.error("Transcript URL not found in completed job.")
+        logger.error("Transcription job failed: %s", reason)
         return None
 
+    # If COMPLETED, read the JSON Transcribe wrote to our bucket (pooled client, with retries)
     try:
-        with urllib.request.urlopen(transcript_uri) as response:
-            transcript_data = json.loads(response.read().decode("utf-8"))
-            return transcript_data["results"]["transcripts"][0]["transcript"]
+        response = s3_client().get_object(Bucket=S3_BUCKET_NAME, Key=_transcribe_output_key(job_name))
+        transcript_data = json.loads(response["Body"].read())
+        return transcript_data["results"]["transcripts"][0]["transcript"]
     except Exception as e:
-        logging.error(f"Error reading transcript JSON: {e}", exc_info=True)
+        logger.error("Error reading transcript JSON: %s", e, exc_info=True)
         return None
 
 
-def translate_text(text: str, target_language: str) -> str:
-    """Translate text using Amazon Translate."""
-    result = translate_client.translate_text(
+def _split_oversized(piece: str, limit: int, measure: Callable[[str], int]) -> Iterator[str]:
+    """Break a sentence that is over the limit into words (and words into slices)."""
+    for word in piece.split():
+        while measure(word) > limit:
+            cut = limit
+            while measure(word[:cut]) > limit:
+                cut -= 1
+            yield word[:cut]
+            word = word[cut:]
+        if word:
+            yield word
+
+
+# Words whose trailing period doesn't end a sentence (compared lowercased, without the period)
+_ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "ft", "vs", "etc",
+    "inc", "ltd", "co", "corp", "dept", "gen", "gov", "sen", "rep", "sgt", "capt", "lt",
+    "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec",
+})
+# Single-letter initials and dotted abbreviations: "J.", "U.S.", "p.m.", "e.g."
+_INITIALS = re.compile(r"(?:[A-Za-z]\.)+")
+
+
+def _ends_with_abbreviation(fragment: str) -> bool:
+    """True if fragment's last word is an abbreviation or initial rather than a sentence end."""
+    word = fragment.rsplit(None, 1)[-1].lstrip("\"'([")
+    return bool(_INITIALS.fullmatch(word)) or word[:-1].lower() in _ABBREVIATIONS
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split text on sentence-ending punctuation, collapsing whitespace inside each sentence.
+
+    A period after an abbreviation ("Mr.", "U.S.", "8 p.m.") doesn't end the sentence.
+    """
+    sentences = []
+    for fragment in re.split(r"(?<=[.!?])\s+", text):
+        fragment = " ".join(fragment.split())
+        if not fragment:
+            continue
+        if sentences and _ends_with_abbreviation(sentences[-1]):
+            sentences[-1] = f"{sentences[-1]} {fragment}"
+        else:
+            sentences.append(fragment)
+    return sentences
+
+
+def _sentence_chunks(text: str, limit: int, measure: Callable[[str], int] = len) -> list[str]:
+    """Split text into sentence-aligned chunks whose measure() stays within limit."""
+    chunks = []
+    current = ""
+    for sentence in _split_sentences(text):
+        pieces = [sentence] if measure(sentence) <= limit else _split_oversized(sentence, limit, measure)
+        for piece in pieces:
+            candidate = f"{current} {piece}" if current else piece
+            if measure(candidate) <= limit:
+                current = candidate
+            else:
+                chunks.append(current)
+                current = piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _utf8_len(text: str) -> int:
+    """Size of text as Translate counts it."""
+    return len(text.encode("utf-8"))
+
+
+def _translate_chunk(client, text: str, target_language: str) -> str:
+    """Translate one request-sized chunk of text."""
+    result = client.translate_text(
         Text=text,
         SourceLanguageCode=SOURCE_LANGUAGE,
         TargetLanguageCode=target_language,
@@ -131,101 +461,570 @@ def translate_text(text: str, target_language: str) -> str:
     return result["TranslatedText"]
 
 
-def synthesize_speech(text: str, target_language: str) -> bytes:
-    """Synthesize speech using Amazon Polly."""
-    # Use a commonly-available Spanish voice + fallback if neural isn't supported in region
-    voice_id = "Lupe" if target_language == "es" else "Joanna"
+_TRANSLATION_CACHE: OrderedDict[str, str] = OrderedDict()
+_TRANSLATION_CACHE_LOCK = threading.Lock()
+_TRANSLATION_CACHE_DIRTY = False
+
+
+def _translation_cache_key(text: str, target_language: str) -> str:
+    """Short content hash identifying text in a given language pair and cache version."""
+    payload = f"v{TRANSLATION_CACHE_VERSION}:{SOURCE_LANGUAGE}:{target_language}:{text}".encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Each batched sentence is sent as "[[n]] sentence"; the numbers must come back intact and
+# in order for the batch to be accepted. 10 bytes covers the marker up to n = 99999.
+_LINE_MARKER = re.compile(r"\[\[(\d+)\]\]")
+_LINE_MARKER_BYTES = 10
+
+
+def _pack_lines(lines: list[str], limit: int, line_overhead: int = 0) -> list[list[str]]:
+    """Group lines, in order, so each group joined by newlines fits in limit UTF-8 bytes.
+
+    line_overhead is added to every line's size (e.g. for a marker prepended later). A line
+    that is over the limit on its own gets a group to itself.
+    """
+    batches = []
+    current = []
+    size = 0
+    for line in lines:
+        line_size = _utf8_len(line) + line_overhead + (1 if current else 0)
+        if current and size + line_size > limit:
+            batches.append(current)
+            current, size = [], 0
+            line_size = _utf8_len(line) + line_overhead
+        current.append(line)
+        size += line_size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _unnumber_lines(translated: str, count: int) -> list[str] | None:
+    """Strip the [[n]] markers from a translated batch, or None if they don't line up."""
+    parts = _LINE_MARKER.split(translated)
+    # parts = [text before first marker, "1", text, "2", text, ...]
+    numbers = [int(number) for number in parts[1::2]]
+    texts = [" ".join(text.split()) for text in parts[2::2]]
+    if parts[0].strip() or numbers != list(range(1, count + 1)) or not all(texts):
+        return None
+    return texts
+
 
+def _translate_batch(client, sentences: list[str], target_language: str) -> list[str]:
+    """Translate sentences in one request and return them in order.
+
+    Each sentence goes out on its own numbered line, and the answer is only used if every
+    number comes back once, in order, with text after it - an equal line count alone can
+    hide a merge plus a split that shifts translations onto the wrong sentences. If the
+    check fails, the batch is split in half and each half retried, so only the part around
+    the offending line ends up sentence by sentence.
+    """
+    if len(sentences) == 1:
+        # Only a single sentence over the request limit needs more than one piece
+        pieces = _sentence_chunks(sentences[0], TRANSLATE_CHUNK_BYTES, _utf8_len)
+        return [" ".join(_translate_chunk(client, piece, target_language) for piece in pieces)]
+
+    numbered = "\n".join(f"[[{i}]] {sentence}" for i, sentence in enumerate(sentences, 1))
+    lines = _unnumber_lines(_translate_chunk(client, numbered, target_language), len(sentences))
+    if lines is not None:
+        return lines
+
+    logger.warning("Translate did not keep sentence markers; retrying %s sentences in two halves", len(sentences))
+    middle = len(sentences) // 2
+    return (
+        _translate_batch(client, sentences[:middle], target_language)
+        + _translate_batch(client, sentences[middle:], target_language)
+    )
+
+
+def _remember_translations(entries: dict[str, str]) -> None:
+    """Add freshly translated sentences to the cache, evicting the least recently used."""
+    global _TRANSLATION_CACHE_DIRTY
+    with _TRANSLATION_CACHE_LOCK:
+        _TRANSLATION_CACHE.update(entries)
+        while len(_TRANSLATION_CACHE) > TRANSLATION_CACHE_SIZE:
+            _TRANSLATION_CACHE.popitem(last=False)
+        _TRANSLATION_CACHE_DIRTY = True
+
+
+def load_translation_cache() -> None:
+    """Seed the translation cache from the previous run's copy in S3, if any."""
     try:
-        response = polly_client.synthesize_speech(
+        response = s3_client().get_object(Bucket=S3_BUCKET_NAME, Key=TRANSLATION_CACHE_KEY)
+        entries = json.loads(response["Body"].read())
+    except s3_client().exceptions.NoSuchKey:
+        return
+    except (BotoCoreError, ClientError, ValueError) as e:
+        logger.warning("Could not load translation cache: %s", e)
+        return
+
+    with _TRANSLATION_CACHE_LOCK:
+        _TRANSLATION_CACHE.update(list(entries.items())[-TRANSLATION_CACHE_SIZE:])
+    logger.info("Loaded %s cached translations.", len(_TRANSLATION_CACHE))
+
+
+def save_translation_cache() -> None:
+    """Write the translation cache back to S3 if this run added anything."""
+    with _TRANSLATION_CACHE_LOCK:
+        if not _TRANSLATION_CACHE_DIRTY:
+            return
+        body = json.dumps(_TRANSLATION_CACHE, ensure_ascii=False).encode("utf-8")
+
+    try:
+        s3_client().put_object(
+            Bucket=S3_BUCKET_NAME,
+            Key=TRANSLATION_CACHE_KEY,
+            Body=body,
+            ContentType="application/json",
+        )
+    except (BotoCoreError, ClientError) as e:
+        logger.warning("Could not save translation cache: %s", e)
+
+
+def translate_text(text: str, target_language: str) -> str:
+    """Translate text using Amazon Translate.
+
+    Sentences already translated (in this run or a cached earlier one) are reused; only
+    the distinct misses are sent, packed into as few requests as the size limit allows.
+    """
+    sentences = _split_sentences(text)
+    keys = [_translation_cache_key(sentence, target_language) for sentence in sentences]
+
+    translations = {}
+    with _TRANSLATION_CACHE_LOCK:
+        for key in keys:
+            if key in _TRANSLATION_CACHE:
+                _TRANSLATION_CACHE.move_to_end(key)
+                translations[key] = _TRANSLATION_CACHE[key]
+
+    misses = {key: sentence for key, sentence in zip(keys, sentences) if key not in translations}
+    if misses:
+        client = translate_client()
+        batches = _pack_lines(list(misses.values()), TRANSLATE_CHUNK_BYTES, _LINE_MARKER_BYTES)
+        if len(batches) == 1:
+            results = _translate_batch(client, batches[0], target_language)
+        else:
+            # Short-lived helper threads share this worker's client rather than building their own
+            with ThreadPoolExecutor(max_workers=TRANSLATE_MAX_WORKERS) as executor:
+                translated = executor.map(lambda batch: _translate_batch(client, batch, target_language), batches)
+                results = [line for batch in translated for line in batch]
+        fresh = dict(zip(misses, results))
+        _remember_translations(fresh)
+        translations.update(fresh)
+
+    return " ".join(translations[key] for key in keys)
+
+
+# Polly voice -> supported engines, listed once per run by whichever thread gets there first
+_VOICE_ENGINES: dict[str, frozenset[str]] | None = None
+_VOICE_ENGINES_DENIED = False
+_VOICE_ENGINES_LOCK = threading.Lock()
+_PERMANENT_ERROR_CODES = frozenset({"AccessDenied", "AccessDeniedException", "UnauthorizedOperation"})
+# When voices can't be listed: the engine that last worked for each voice
+_FALLBACK_ENGINES: dict[str, str] = {}
+
+
+def _list_voice_engines() -> dict[str, frozenset[str]]:
+    """Map each Polly voice id to the engines it supports."""
+    engines = {}
+    kwargs = {}
+    while True:
+        resp = polly_client().describe_voices(**kwargs)
+        for voice in resp["Voices"]:
+            engines[voice["Id"]] = frozenset(voice.get("SupportedEngines", []))
+        if not resp.get("NextToken"):
+            break
+        kwargs["NextToken"] = resp["NextToken"]
+    return engines
+
+
+def _voice_engines() -> dict[str, frozenset[str]] | None:
+    """Return the voice -> engines map, or None if it can't be listed.
+
+    Only one thread lists at a time; the others wait and share its result. A permanent
+    failure (e.g. no polly:DescribeVoices) is remembered for the run, a transient one is
+    retried on the next call.
+    """
+    global _VOICE_ENGINES, _VOICE_ENGINES_DENIED
+    with _VOICE_ENGINES_LOCK:
+        if _VOICE_ENGINES is None and not _VOICE_ENGINES_DENIED:
+            try:
+                _VOICE_ENGINES = _list_voice_engines()
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in _PERMANENT_ERROR_CODES:
+                    _VOICE_ENGINES_DENIED = True
+                    logger.warning("Not allowed to list Polly voices, trying neural then standard: %s", e)
+                else:
+                    logger.warning("Could not list Polly voices (will retry): %s", e)
+            except BotoCoreError as e:
+                logger.warning("Could not list Polly voices (will retry): %s", e)
+        return _VOICE_ENGINES
+
+
+def _polly_engine(voice_id: str) -> str | None:
+    """Prefer the neural engine when the voice supports it in this region.
+
+    Returns None when engine support is unknown and no engine has worked for the voice yet.
+    """
+    engines = _voice_engines()
+    if engines is None:
+        return _FALLBACK_ENGINES.get(voice_id)
+    return "neural" if "neural" in engines.get(voice_id, ()) else "standard"
+
+
+def _synthesize_chunk(client, text: str, voice_id: str, engine: str | None) -> BinaryIO:
+    """Call Polly for one chunk of text and return the (unread) MP3 stream.
+
+    With engine None, neural is tried first and standard used if it isn't available; the
+    engine that worked is remembered so later chunks for the voice go straight to it.
+    """
+    try:
+        response = client.synthesize_speech(
             VoiceId=voice_id,
             OutputFormat="mp3",
             Text=text,
-            Engine="neural",
+            Engine=engine or "neural",
         )
-    except polly_client.exceptions.InvalidParameterValueException:
+        engine = engine or "neural"
+    except client.exceptions.InvalidParameterValueException:
+        if engine is not None:
+            raise
         # Fallback to standard engine if neural isn't available for the voice/region
-        response = polly_client.synthesize_speech(
+        response = client.synthesize_speech(
             VoiceId=voice_id,
             OutputFormat="mp3",
             Text=text,
             Engine="standard",
         )
+        engine = "standard"
+    _FALLBACK_ENGINES.setdefault(voice_id, engine)
+    return response["AudioStream"]
 
-    return response["AudioStream"].read()
 
+class _AudioStreamError(Exception):
+    """Reading synthesized audio from Polly failed (as opposed to writing it to S3)."""
 
-def process_file(file_path: str) -> None:
-    """Main processing function for a single mp3 file."""
-    filename = os.path.basename(file_path)
-    base, _ = os.path.splitext(filename)
 
-    # Build S3 key for audio input
-    s3_key_audio_input = f"{ENVIRONMENT}/audio_inputs/{filename}"
+class _PollyAudioStream:
+    """Read-only wrapper over a Polly AudioStream that re-raises read failures as _AudioStreamError.
 
-    # Ensure Transcribe job name is valid: letters, numbers, underscore, hyphen
-    safe_base = re.sub(r"[^A-Za-z0-9_-]", "-", base)
-    transcribe_job_name = f"job-{safe_base}-{int(time.time())}"
+    The single-request stream is only read while it is uploaded, so this keeps Polly
+    failures distinguishable from S3 ones sharing the same transfer.
+    """
 
-    # Upload input to S3
-    if not upload_to_s3(file_path, s3_key_audio_input):
-        return
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
 
-    # Start transcription
-    s3_uri_input = f"s3://{S3_BUCKET_NAME}/{s3_key_audio_input}"
-    start_transcription_job(transcribe_job_name, s3_uri_input)
+    def read(self, size: int = -1) -> bytes:
+        try:
+            return self._stream.read(size)
+        except BotoCoreError as e:
+            raise _AudioStreamError(f"Polly audio stream failed: {e}") from e
 
-    # Wait for transcript
-    transcript_text = get_transcription_result(transcribe_job_name)
-    if not transcript_text:
-        logging.error("Processing failed at transcription stage.")
-        return
 
-    # Translate + TTS
-    try:
-        translated_text = translate_text(transcript_text, TARGET_LANGUAGE)
-        audio_bytes = synthesize_speech(translated_text, TARGET_LANGUAGE)
-    except Exception as e:
-        logging.error(f"Translate/Polly stage failed: {e}", exc_info=True)
-        return
+def _strip_id3(data: bytes) -> bytes:
+    """Drop a leading ID3v2 tag so only raw MP3 frames remain."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return data
+    # Tag size is a 28-bit "syncsafe" integer (7 bits per byte), excluding the 10-byte header
+    size = ((data[6] & 0x7F) << 21) | ((data[7] & 0x7F) << 14) | ((data[8] & 0x7F) << 7) | (data[9] & 0x7F)
+    if data[5] & 0x10:
+        size += 10  # footer present
+    return data[10 + size:]
 
-    # Upload results to S3
-    try:
+
+def _join_mp3(parts: list[bytes]) -> bytes:
+    """Concatenate MP3 chunks, keeping only the first chunk's ID3 tag."""
+    return b"".join([parts[0], *(_strip_id3(part) for part in parts[1:])])
+
+
+def synthesize_speech(text: str, target_language: str) -> BinaryIO:
+    """Synthesize speech using Amazon Polly and return the MP3 as a readable stream."""
+    # Use a commonly-available Spanish voice; neural if the region supports it for that voice
+    voice_id = "Lupe" if target_language == "es" else "Joanna"
+    engine = _polly_engine(voice_id)
+
+    client = polly_client()
+    chunks = _sentence_chunks(text, POLLY_CHUNK_CHARS)
+    if len(chunks) <= 1:
+        # Common case: a single request, streamed straight through
+        return _PollyAudioStream(_synthesize_chunk(client, text, voice_id, engine))
+
+    # Long text: synthesize chunks in parallel; MP3 frames concatenate without re-encoding
+    with ThreadPoolExecutor(max_workers=POLLY_MAX_WORKERS) as executor:
+        parts = list(executor.map(lambda chunk: _synthesize_chunk(client, chunk, voice_id, engine).read(), chunks))
+    return io.BytesIO(_join_mp3(parts))
+
+
+def _upload_results(
+    s3_key: str,
+    transcript_text: str,
+    translated_text: str,
+    audio_stream: BinaryIO,
+    job_name: str | None = None,
+) -> None:
+    """Upload transcript, translation and audio for the input at s3_key.
+
+    job_name identifies the batch Transcribe job whose JSON output can be copied for
+    large transcripts; streaming runs have no such output and always upload text.
+    """
+    base = _output_base(s3_key)
+
+    # The three uploads are independent, so overlap their round-trips; helper threads
+    # share this worker's client.
+    s3 = s3_client()
+    transcript_bytes = transcript_text.encode("utf-8")
+    if job_name is None or len(transcript_bytes) < TRANSCRIPT_COPY_BYTES:
         # 1) Transcript
-        s3_client.put_object(
+        transcript_upload = functools.partial(
+            s3.put_object,
             Bucket=S3_BUCKET_NAME,
             Key=f"{ENVIRONMENT}/transcripts/{base}.txt",
-            Body=transcript_text.encode("utf-8"),
+            Body=transcript_bytes,
             ContentType="text/plain; charset=utf-8",
         )
+    else:
+        # 1) Transcript (large): server-side copy of the Transcribe output, no bytes sent
+        transcript_upload = functools.partial(
+            s3.copy_object,
+            Bucket=S3_BUCKET_NAME,
+            Key=f"{ENVIRONMENT}/transcripts/{base}.json",
+            CopySource={"Bucket": S3_BUCKET_NAME, "Key": _transcribe_output_key(job_name)},
+            MetadataDirective="REPLACE",
+            ContentType="application/json",
+        )
 
+    uploads = [
+        transcript_upload,
         # 2) Translation
-        s3_client.put_object(
+        functools.partial(
+            s3.put_object,
             Bucket=S3_BUCKET_NAME,
             Key=f"{ENVIRONMENT}/translations/{base}_{TARGET_LANGUAGE}.txt",
             Body=translated_text.encode("utf-8"),
             ContentType="text/plain; charset=utf-8",
-        )
+        ),
+        # 3) Audio Output (streamed from Polly when it fits in one request)
+        functools.partial(
+            s3.upload_fileobj,
+            audio_stream,
+            S3_BUCKET_NAME,
+            f"{ENVIRONMENT}/audio-outputs/{base}_{TARGET_LANGUAGE}.mp3",
+            ExtraArgs={"ContentType": "audio/mpeg"},
+            Config=AUDIO_UPLOAD_CONFIG,
+        ),
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=len(uploads)) as executor:
+            for future in [executor.submit(upload) for upload in uploads]:
+                future.result()
 
-        # 3) Audio Output
-        s3_client.put_object(
-            Bucket=S3_BUCKET_NAME,
-            Key=f"{ENVIRONMENT}/audio-outputs/{base}_{TARGET_LANGUAGE}.mp3",
-            Body=audio_bytes,
-            ContentType="audio/mpeg",
+        logger.info("Successfully processed %s", s3_key)
+    except _AudioStreamError as e:
+        # The single-chunk Polly stream is only read during the upload, so its read
+        # errors surface here rather than in the Translate/Polly stage
+        logger.error("Translate/Polly stage failed while streaming audio: %s", e, exc_info=True)
+    except (BotoCoreError, ClientError, S3UploadFailedError) as e:
+        logger.error("Error uploading results to S3: %s", e, exc_info=True)
+
+
+def _import_transcribe_streaming():
+    """Import the optional Transcribe streaming SDK, with a hint if it is missing."""
+    try:
+        from amazon_transcribe.client import TranscribeStreamingClient
+        from amazon_transcribe.model import TranscriptEvent
+    except ImportError as e:
+        raise RuntimeError(
+            "TRANSCRIBE_MODE=streaming needs the amazon-transcribe package (pip install amazon-transcribe)"
+        ) from e
+    return TranscribeStreamingClient, TranscriptEvent
+
+
+async def _stream_pipeline(s3_key: str) -> tuple[str, str, bytes]:
+    """Transcribe an S3 mp3 via Transcribe streaming, translating and synthesizing each
+    finalized segment as soon as it arrives.
+
+    Returns (transcript, translation, mp3 bytes).
+    """
+    TranscribeStreamingClient, TranscriptEvent = _import_transcribe_streaming()
+
+    # Transcribe streaming takes PCM, not MP3: pipe the object through ffmpeg. The bytes
+    # come from our own GetObject, so no URL or credentials end up on ffmpeg's command line.
+    decoder = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-nostdin", "-loglevel", "error", "-f", "mp3", "-i", "pipe:0",
+        "-f", "s16le", "-ac", "1", "-ar", str(STREAMING_SAMPLE_RATE), "pipe:1",
+        # stdin carries the MP3, never the terminal (several decoders run at once; a "q"
+        # typed there would stop one) and -nostdin keeps ffmpeg from reading commands off it
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    decoder_errors = asyncio.ensure_future(decoder.stderr.read())
+
+    try:
+        client = TranscribeStreamingClient(region=_SESSION.region_name)
+        stream = await client.start_stream_transcription(
+            language_code="en-US",
+            media_sample_rate_hz=STREAMING_SAMPLE_RATE,
+            media_encoding="pcm",
         )
 
-        logging.info(f"Successfully processed {filename}")
-    except ClientError as e:
-        logging.error(f"Error uploading results to S3: {e}", exc_info=True)
+        segments: asyncio.Queue[str | None] = asyncio.Queue()
+        transcript, translations, audio_parts = [], [], []
+
+        async def feed_decoder() -> None:
+            # Boto3 reads are blocking, so they run in the loop's thread pool
+            response = await asyncio.to_thread(
+                lambda: s3_client().get_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
+            )
+            body = response["Body"]
+            try:
+                while chunk := await asyncio.to_thread(body.read, STREAMING_CHUNK_BYTES * 8):
+                    decoder.stdin.write(chunk)
+                    await decoder.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # ffmpeg exited early; send_audio reports why
+            finally:
+                body.close()
+                decoder.stdin.close()
+
+        async def send_audio() -> None:
+            while chunk := await decoder.stdout.read(STREAMING_CHUNK_BYTES):
+                await stream.input_stream.send_audio_event(audio_chunk=chunk)
+            await stream.input_stream.end_stream()
+            if await decoder.wait() != 0:
+                errors = (await decoder_errors).decode("utf-8", "replace").strip()
+                raise RuntimeError(f"ffmpeg failed to decode s3://{S3_BUCKET_NAME}/{s3_key}: {errors}")
+
+        async def receive_segments() -> None:
+            async for event in stream.output_stream:
+                if isinstance(event, TranscriptEvent):
+                    for result in event.transcript.results:
+                        if not result.is_partial and result.alternatives:
+                            await segments.put(result.alternatives[0].transcript)
+            await segments.put(None)
+
+        async def translate_and_speak() -> None:
+            # Boto3 calls are blocking, so they run in the loop's thread pool
+            while (segment := await segments.get()) is not None:
+                if not segment.strip():
+                    continue
+                translated = await asyncio.to_thread(translate_text, segment, TARGET_LANGUAGE)
+                audio = await asyncio.to_thread(lambda: synthesize_speech(translated, TARGET_LANGUAGE).read())
+                transcript.append(segment)
+                translations.append(translated)
+                audio_parts.append(audio)
+
+        await asyncio.gather(feed_decoder(), send_audio(), receive_segments(), translate_and_speak())
+    finally:
+        if decoder.returncode is None:
+            decoder.kill()
+            await decoder.wait()
+        decoder_errors.cancel()
+
+    if not transcript:
+        return "", "", b""
+    return " ".join(transcript), " ".join(translations), _join_mp3(audio_parts)
+
+
+def process_key(s3_key: str) -> None:
+    """Main processing function for a single mp3 already in S3 (Transcribe reads it in place)."""
+    base = _output_base(s3_key)
+
+    if TRANSCRIBE_MODE == "streaming":
+        try:
+            transcript_text, translated_text, audio_bytes = asyncio.run(_stream_pipeline(s3_key))
+        except Exception as e:
+            logger.error("Streaming transcription failed: %s", e, exc_info=True)
+            return
+        if not transcript_text:
+            logger.error("Processing failed at transcription stage.")
+            return
+        _upload_results(s3_key, transcript_text, translated_text, io.BytesIO(audio_bytes))
+        return
+
+    # Ensure Transcribe job name is valid: letters, numbers, underscore, hyphen (max 200).
+    # Files start concurrently and different names can sanitize to the same base, so a
+    # random suffix (not a timestamp) keeps job names unique. The run prefix lets the
+    # events dispatcher tell this run's jobs apart on a shared queue.
+    safe_base = re.sub(r"[^A-Za-z0-9_-]", "-", base)[:150]
+    transcribe_job_name = f"{_JOB_NAME_PREFIX}{safe_base}-{uuid.uuid4().hex}"
+
+    # Start transcription
+    s3_uri_input = f"s3://{S3_BUCKET_NAME}/{s3_key}"
+    if not start_transcription_job(transcribe_job_name, s3_uri_input):
+        return
+
+    # Wait for transcript
+    transcript_text = get_transcription_result(transcribe_job_name)
+    if not transcript_text:
+        logger.error("Processing failed at transcription stage.")
+        return
+
+    # Translate + TTS
+    try:
+        translated_text = translate_text(transcript_text, TARGET_LANGUAGE)
+        audio_stream = synthesize_speech(translated_text, TARGET_LANGUAGE)
+    except Exception as e:
+        logger.error("Translate/Polly stage failed: %s", e, exc_info=True)
+        return
+
+    _upload_results(s3_key, transcript_text, translated_text, audio_stream, transcribe_job_name)
+
+
+def process_file(file_path: str) -> None:
+    """Upload a local mp3 file to the input prefix, then process it from S3."""
+    s3_key = f"{ENVIRONMENT}/audio_inputs/{os.path.basename(file_path)}"
+    if upload_to_s3(file_path, s3_key):
+        process_key(s3_key)
 
 
 if __name__ == "__main__":
-    download_inputs_from_s3()
-    
-    if not os.path.exists(INPUT_FOLDER):
-        logging.error(f"Input folder '{INPUT_FOLDER}' does not exist.")
-    else:
-        for fname in os.listdir(INPUT_FOLDER):
-            if fname.lower().endswith(".mp3"):
-                process_file(os.path.join(INPUT_FOLDER, fname))
+    # Clients (and their connection pools) are per thread, so only the process-wide Polly
+    # voice lookup is worth doing early - list voices while S3 is listed.
+    threading.Thread(target=_voice_engines, name="polly-voices", daemon=True).start()
+
+    prefix = f"{ENVIRONMENT}/audio_inputs/"
+    load_translation_cache()
+
+    # Each file spends most of its time waiting on S3/Transcribe/Translate/Polly,
+    # so run them side by side instead of one after another.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+
+        # Two inputs with the same output base (e.g. x.mp3 and x.MP3) would race to
+        # write the same output keys; only the first one is processed.
+        claimed = {}
+
+        def claim(key: str) -> bool:
+            base = _output_base(key)
+            if base in claimed:
+                if claimed[base] != key:
+                    logger.warning("Skipping %s: outputs for %s are already produced from %s", key, base, claimed[base])
+                return False
+            claimed[base] = key
+            return True
+
+        # Inputs already in S3 are transcribed in place - nothing is downloaded
+        for key in _iter_mp3_keys(prefix):
+            if claim(key):
+                futures[executor.submit(process_key, key)] = key
+
+        # Local-only inputs (e.g. committed to the repo) are uploaded first
+        if os.path.isdir(INPUT_FOLDER):
+            for fname in os.listdir(INPUT_FOLDER):
+                path = os.path.join(INPUT_FOLDER, fname)
+                if fname.lower().endswith(".mp3") and claim(f"{prefix}{fname}"):
+                    futures[executor.submit(process_file, path)] = path
+
+        if not futures:
+            logger.info("No MP3 inputs found in s3://%s/%s or '%s'", S3_BUCKET_NAME, prefix, INPUT_FOLDER)
+
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Unexpected error processing %s: %s", futures[future], e, exc_info=True)
+
+    save_translation_cache()